@@ -1,69 +1,114 @@
 """Configuration management for the Human-in-the-Loop MCP server."""
 
+import functools
 import os
+import sys
 from dataclasses import dataclass
-from typing import Optional
 
 import click
 from loguru import logger
 
+# Lazily populated snapshot of the environment variables we care about, so
+# repeated config resolution does not go back to os.environ each time. Only
+# hits are cached: a miss must stay retryable once the variable is set.
+_ENV_CACHE: dict[str, str] = {}
 
-@dataclass(frozen=True)
+
+def _getenv_cached(name: str) -> str | None:
+    """Return an environment variable, caching successful lookups."""
+    value = _ENV_CACHE.get(name)
+    if value is None:
+        value = os.getenv(name)
+        if value is not None:
+            _ENV_CACHE[name] = value
+    return value
+
+
+@dataclass(frozen=True, slots=True)
 class Config:
     """Configuration for the Human-in-the-Loop MCP server."""
-    
+
     slack_app_token: str
     slack_bot_token: str
     slack_channel_id: str
     slack_user_id: str
     log_level: str = "INFO"
-    
+
     @classmethod
     def from_args(
         cls,
         slack_channel_id: str,
         slack_user_id: str,
-        slack_app_token: Optional[str] = None,
-        slack_bot_token: Optional[str] = None,
+        slack_app_token: str | None = None,
+        slack_bot_token: str | None = None,
         log_level: str = "INFO",
     ) -> "Config":
-        """Create config from command line arguments and environment variables."""
-        
-        # Get tokens from environment if not provided
-        app_token = slack_app_token or os.getenv("SLACK_APP_TOKEN")
-        bot_token = slack_bot_token or os.getenv("SLACK_BOT_TOKEN")
-        
-        if not app_token:
-            raise click.ClickException(
-                "SLACK_APP_TOKEN must be provided via environment variable"
-            )
-        
-        if not bot_token:
-            raise click.ClickException(
-                "SLACK_BOT_TOKEN must be provided via environment variable"
-            )
-        
-        config = cls(
-            slack_app_token=app_token,
-            slack_bot_token=bot_token,
-            slack_channel_id=slack_channel_id,
-            slack_user_id=slack_user_id,
-            log_level=log_level,
+        """Create config from command line arguments and environment variables.
+
+        The resolved config is memoized per argument set, so re-invocations
+        (e.g. during tests or reloads) reuse the same frozen instance.
+        """
+        return _build_config(
+            slack_channel_id,
+            slack_user_id,
+            slack_app_token,
+            slack_bot_token,
+            log_level,
+        )
+
+
+@functools.cache
+def _build_config(
+    slack_channel_id: str,
+    slack_user_id: str,
+    slack_app_token: str | None,
+    slack_bot_token: str | None,
+    log_level: str,
+) -> Config:
+    """Resolve and validate a `Config`, falling back to the environment for tokens."""
+    app_token = slack_app_token or _getenv_cached("SLACK_APP_TOKEN")
+    bot_token = slack_bot_token or _getenv_cached("SLACK_BOT_TOKEN")
+
+    if not app_token:
+        raise click.ClickException(
+            "SLACK_APP_TOKEN must be provided via environment variable"
+        )
+
+    if not bot_token:
+        raise click.ClickException(
+            "SLACK_BOT_TOKEN must be provided via environment variable"
         )
-        
-        logger.info("Configuration loaded successfully")
-        return config
+
+    config = Config(
+        slack_app_token=app_token,
+        slack_bot_token=bot_token,
+        slack_channel_id=slack_channel_id,
+        slack_user_id=slack_user_id,
+        log_level=log_level,
+    )
+
+    logger.info("Configuration loaded successfully")
+    return config
+
+
+# Compiled once at import; loguru parses the format string per handler, not per record.
+_LOG_FORMAT = (
+    "<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
+    "<level>{level: <8}</level> | "
+    "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
+    "<level>{message}</level>"
+)
 
 
 def setup_logging(level: str = "INFO") -> None:
     """Setup logging configuration."""
     logger.remove()  # Remove default handler
+    # Write to stderr directly (loguru's fast path) and hand records to a
+    # background queue so I/O never blocks the event-loop thread.
     logger.add(
-        lambda msg: print(msg, end=""),
-        format="<green>{time:YYYY-MM-DD HH:mm:ss}</green> | "
-               "<level>{level: <8}</level> | "
-               "<cyan>{name}</cyan>:<cyan>{function}</cyan>:<cyan>{line}</cyan> - "
-               "<level>{message}</level>",
+        sys.stderr,
+        format=_LOG_FORMAT,
         level=level,
-        colorize=True,
-    )
\ No newline at end of file
+        colorize=sys.stderr.isatty(),
+        enqueue=True,
+    )
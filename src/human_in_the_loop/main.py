@@ -3,6 +3,7 @@
 import asyncio
 import signal
 import sys
+import threading
 from typing import Optional
 
 import click
@@ -24,15 +25,41 @@ def signal_handler(signum, frame):
     raise GracefulExit()
 
 
+def _setup_signal_handlers() -> None:
+    """Register shutdown signal handlers.
+
+    Signal handlers can only be installed from the main thread; skip them
+    when embedded elsewhere. Prefer asyncio's loop-integrated handlers over
+    signal.signal where the platform supports them; those run as loop
+    callbacks, so they cancel the server task rather than raising.
+    """
+    if threading.current_thread() is not threading.main_thread():
+        return
+
+    loop = asyncio.get_running_loop()
+    task = asyncio.current_task()
+
+    def _request_shutdown(signum: int) -> None:
+        logger.info(f"Received signal {signum}, initiating graceful shutdown...")
+        if task is not None:
+            task.cancel()
+
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, _request_shutdown, sig)
+        except NotImplementedError:
+            # e.g. Windows event loops
+            signal.signal(sig, signal_handler)
+
+
 async def run_server(config: Config) -> None:
     """Run the human-in-the-loop MCP server."""
     slack_client = None
     
     try:
         # Setup signal handlers for graceful shutdown
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
-        
+        _setup_signal_handlers()
+
         # Initialize Slack client
         slack_client = SlackClient(
             app_token=config.slack_app_token,
@@ -51,15 +78,20 @@ async def run_server(config: Config) -> None:
         logger.info("Starting services...")
         
         slack_task = asyncio.create_task(slack_client.start())
-        
-        # Give Slack a moment to connect
-        await asyncio.sleep(2)
-        
+
+        # Proceed as soon as the socket-mode connection is actually ready
+        # instead of sleeping a fixed amount of time
+        try:
+            async with asyncio.timeout(10):
+                await slack_client.wait_until_ready()
+        except TimeoutError:
+            logger.warning("Slack connection not confirmed after 10s, continuing startup...")
+
         # Start MCP server
         logger.info("Human-in-the-Loop MCP server is ready!")
         await mcp_server.run()
         
-    except GracefulExit:
+    except (GracefulExit, asyncio.CancelledError):
         logger.info("Graceful shutdown initiated")
     except KeyboardInterrupt:
         logger.info("Received keyboard interrupt, shutting down...")
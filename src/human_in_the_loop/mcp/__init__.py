@@ -3,4 +3,4 @@
 from .server import HumanMCPServer
 from .tools import HumanTools
 
-__all__ = ["HumanMCPServer", "HumanTools"]
+__all__ = ("HumanMCPServer", "HumanTools")
@@ -1,12 +1,12 @@
 """MCP server implementation for human-in-the-loop interactions."""
 
-import asyncio
-from typing import Any, Dict, List, Sequence
+from typing import Any
 
 from loguru import logger
-from mcp.server.lowlevel import Server, NotificationOptions
-from mcp.server.models import InitializationOptions
 from mcp import types
+from mcp.server.lowlevel import NotificationOptions, Server
+from mcp.server.models import InitializationOptions
+from pydantic import ValidationError
 
 from .tools import HumanInterface, HumanTools
 
@@ -27,30 +27,27 @@ class HumanMCPServer:
         logger.info("MCP server initialized")
 
     def _register_handlers(self) -> None:
-        """Register MCP message handlers."""
-
-        @self.server.list_tools()
-        async def handle_list_tools() -> List[types.Tool]:
-            """Handle list_tools request."""
-            logger.debug("Handling list_tools request")
-            tools = self.human_tools.get_tools()
-            return tools
-
-        @self.server.call_tool()
-        async def handle_call_tool(
-            name: str, arguments: Dict[str, Any]
-        ) -> List[types.TextContent]:
-            """Handle call_tool request."""
-            logger.debug(f"Handling call_tool request: {name}")
-            try:
-                content = await self.human_tools.call_tool(name, arguments)
-                return content
-            except Exception as e:
-                logger.error(f"Error calling tool {name}: {e}")
-                error_content = [
-                    types.TextContent(type="text", text=f"Error: {str(e)}")
-                ]
-                return error_content
+        """Register MCP message handlers.
+
+        Handlers are bound methods rather than nested closures, saving a
+        frame and a cell lookup per RPC.
+        """
+        self.server.list_tools()(self._handle_list_tools)
+        self.server.call_tool()(self._handle_call_tool)
+
+    async def _handle_list_tools(self) -> list[types.Tool]:
+        """Handle list_tools request."""
+        logger.debug("Handling list_tools request")
+        return self.human_tools.get_tools()
+
+    async def _handle_call_tool(self, name: str, arguments: dict[str, Any]) -> list[types.TextContent]:
+        """Handle call_tool request."""
+        logger.debug(f"Handling call_tool request: {name}")
+        try:
+            return await self.human_tools.call_tool(name, arguments)
+        except (TypeError, ValueError, RuntimeError, ValidationError) as e:
+            logger.error(f"Error calling tool {name}: {e}")
+            return [types.TextContent(type="text", text=f"Error: {e!s}")]
 
     async def run(self) -> None:
         """Run the MCP server."""
@@ -31,39 +31,43 @@ class AskHumanRequest(BaseModel):
     )
 
 
+# Tool descriptors are static, so build them once at import time rather than
+# re-validating the schema dict on every list_tools request.
+_ASK_HUMAN_TOOL = types.Tool(
+    name="ask_human",
+    description=(
+        "Ask a human for information that only they would know, such as "
+        "personal preferences, project-specific context, local environment "
+        "details, or non-public information"
+    ),
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "question": {
+                "type": "string",
+                "description": (
+                    "The question to ask the human. Be specific and provide "
+                    "context to help the human understand what information you need."
+                ),
+            }
+        },
+        "required": ["question"],
+    },
+)
+
+
 class HumanTools:
     """Collection of human-in-the-loop tools."""
 
     def __init__(self, human_interface: HumanInterface) -> None:
         """Initialize HumanTools with a human interface."""
         self.human_interface = human_interface
+        self._tools_cache: list[types.Tool] = [_ASK_HUMAN_TOOL]
         logger.info("Human tools initialized")
 
     def get_tools(self) -> list[types.Tool]:
         """Get all available tools."""
-        return [
-            types.Tool(
-                name="ask_human",
-                description=(
-                    "Ask a human for information that only they would know, such as "
-                    "personal preferences, project-specific context, local environment "
-                    "details, or non-public information"
-                ),
-                inputSchema={
-                    "type": "object",
-                    "properties": {
-                        "question": {
-                            "type": "string",
-                            "description": (
-                                "The question to ask the human. Be specific and provide "
-                                "context to help the human understand what information you need."
-                            ),
-                        }
-                    },
-                    "required": ["question"],
-                },
-            )
-        ]
+        return self._tools_cache
 
     async def call_tool(self, name: str, arguments: dict[str, Any]) -> list[types.TextContent]:
         """Call a tool with the given arguments."""
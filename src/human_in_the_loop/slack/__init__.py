@@ -2,4 +2,4 @@
 
 from .client import HumanInterface, SlackClient
 
-__all__ = ["SlackClient", "HumanInterface"]
\ No newline at end of file
+__all__ = ("SlackClient", "HumanInterface")
\ No newline at end of file
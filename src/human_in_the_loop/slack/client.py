@@ -1,29 +1,49 @@
 """Slack client for human-in-the-loop communication."""
 
 import asyncio
+from dataclasses import dataclass
 
 from loguru import logger
 from slack_bolt.adapter.socket_mode.async_handler import AsyncSocketModeHandler
 from slack_bolt.app.async_app import AsyncApp
+from slack_sdk.errors import SlackApiError
 from slack_sdk.web.async_client import AsyncWebClient
 
+from .formatting import fallback_thread_title
+
+
+@dataclass(slots=True)
+class _ThreadState:
+    """Per-thread conversation state, resolved with a single dict lookup.
+
+    Presence in SlackClient._threads marks the thread as ours; `future`
+    holds the pending response wait, if any.
+    """
+
+    future: asyncio.Future[str] | None = None
+
 
 class SlackClient:
     """Handles Slack communication for human-in-the-loop interactions."""
 
-    MAX_THREAD_TITLE_LENGTH = 100
+    THREAD_HEADER = "🤖 *Question from AI Assistant*\n"
+    RESPONSE_TIMEOUT = 600  # seconds to wait for a human response
 
     def __init__(self, app_token: str, bot_token: str, channel_id: str, user_id: str) -> None:
         """Initialize SlackClient with tokens and channel/user IDs."""
         self.channel_id = channel_id
         self.user_id = user_id
+        # Precomputed once; the user mention never changes per client
+        self._mention_prefix = f"<@{user_id}> "
         self.app = AsyncApp(token=bot_token)
         self.handler = AsyncSocketModeHandler(self.app, app_token)
         self.client = AsyncWebClient(token=bot_token)
 
         # Track active conversations
-        self._pending_responses: dict[str, asyncio.Future[str]] = {}
-        self._active_threads: set[str] = set()
+        self._threads: dict[str, _ThreadState] = {}
+
+        # Set once the socket-mode connection is established
+        self._ready = asyncio.Event()
 
         # Setup message event handler
         self.app.event("message")(self._handle_message)
@@ -31,9 +51,19 @@ class SlackClient:
         logger.info("Slack client initialized")
 
     async def start(self) -> None:
-        """Start the Slack client."""
+        """Start the Slack client and block until stop() is called."""
         logger.info("Starting Slack client...")
-        await self.handler.start_async()
+        await self.handler.connect_async()
+        self._ready.set()
+        # Keep the task alive, mirroring AsyncSocketModeHandler.start_async()
+        await asyncio.Event().wait()
+
+    async def wait_until_ready(self) -> None:
+        """Wait until the socket-mode connection is established.
+
+        Callers that need a bound should wrap this in asyncio.timeout().
+        """
+        await self._ready.wait()
 
     async def stop(self) -> None:
         """Stop the Slack client."""
@@ -54,7 +84,7 @@ class SlackClient:
                 thread_ts = await self._create_thread(question)
 
             # Send the question with user mention
-            message_text = f"<@{self.user_id}> {question}"
+            message_text = self._mention_prefix + question
             await self.client.chat_postMessage(
                 channel=self.channel_id,
                 text=message_text,
@@ -64,6 +94,11 @@ class SlackClient:
             # Wait for response
             response = await self._wait_for_response(thread_ts)
             logger.info("Received response from human")
+        except SlackApiError as e:
+            # Surface Slack failures as the RuntimeError contract callers handle
+            logger.error(f"Slack API error in ask_human: {e}")
+            msg = f"Slack API error: {e.response.get('error', 'unknown_error')}"
+            raise RuntimeError(msg) from e
         except Exception as e:
             logger.error(f"Error in ask_human: {e}")
             raise
@@ -72,38 +107,52 @@ class SlackClient:
 
     async def _create_thread(self, question: str) -> str:
         """Create a thread for the conversation."""
-        thread_title = question[: self.MAX_THREAD_TITLE_LENGTH].strip()
-        if len(question) > self.MAX_THREAD_TITLE_LENGTH:
-            thread_title += "..."
+        thread_title = fallback_thread_title(question)
 
         # Post initial message to create thread
         result = await self.client.chat_postMessage(
             channel=self.channel_id,
-            text=f"🤖 *Question from AI Assistant*\n{thread_title}",
+            text=self.THREAD_HEADER + thread_title,
         )
 
         thread_ts = result.get("ts")
         if not isinstance(thread_ts, str):
             msg = "Failed to get thread timestamp from Slack response."
             raise TypeError(msg)
-        self._active_threads.add(thread_ts)
+        self._threads[thread_ts] = _ThreadState()
         logger.debug(f"Created thread {thread_ts}")
         return thread_ts
 
     async def _wait_for_response(self, thread_ts: str) -> str:
         """Wait for a human response in the specified thread."""
-        future = asyncio.Future[str]()
-        self._pending_responses[thread_ts] = future
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[str] = loop.create_future()
+        state = self._threads.setdefault(thread_ts, _ThreadState())
+        state.future = future
+
+        # Cancel the future directly on timeout; cheaper than wrapping it in
+        # an extra task via asyncio.wait_for. Record that the timer fired so
+        # external cancellation (e.g. shutdown) is not mistaken for a timeout.
+        timed_out = False
+
+        def _on_timeout() -> None:
+            nonlocal timed_out
+            timed_out = True
+            future.cancel()
+
+        timeout_handle = loop.call_later(self.RESPONSE_TIMEOUT, _on_timeout)
 
         try:
-            # Wait for response with timeout (10 minutes default)
-            return await asyncio.wait_for(future, timeout=600)
-        except TimeoutError as err:
+            return await future
+        except asyncio.CancelledError as err:
+            if not timed_out:
+                raise
             logger.error(f"Timeout waiting for response in thread {thread_ts}")
             msg = "Timeout waiting for human response"
             raise RuntimeError(msg) from err
         finally:
-            self._pending_responses.pop(thread_ts, None)
+            timeout_handle.cancel()
+            state.future = None
 
     async def _handle_message(self, event: dict) -> None:
         """Handle incoming Slack messages."""
@@ -112,9 +161,10 @@ class SlackClient:
             if event.get("user") != self.user_id:
                 return
 
-            # Only process messages in active threads
+            # Only process messages in threads we created (single dict probe)
             thread_ts = event.get("thread_ts")
-            if not thread_ts or thread_ts not in self._active_threads:
+            state = self._threads.get(thread_ts) if thread_ts else None
+            if state is None:
                 return
 
             # Get the message text
@@ -122,12 +172,11 @@ class SlackClient:
             if not message_text:
                 return
 
-            # Check if we're waiting for a response in this thread
-            if thread_ts in self._pending_responses:
-                future = self._pending_responses[thread_ts]
-                if not future.done():
-                    future.set_result(message_text)
-                    logger.debug(f"Received response in thread {thread_ts}")
+            # Resolve the pending response, if any
+            future = state.future
+            if future is not None and not future.done():
+                future.set_result(message_text)
+                logger.debug(f"Received response in thread {thread_ts}")
 
         except (TypeError, ValueError) as e:
             logger.error(f"Error handling message: {e}")
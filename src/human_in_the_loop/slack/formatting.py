@@ -1,10 +1,80 @@
 """Utilities for formatting Slack messages with Block Kit."""
 
-# Use built-in types and new union syntax per PEP 585/604
-from loguru import logger
+import functools
+import json
+import re
+from collections.abc import Mapping
+from types import MappingProxyType
+
+# orjson is an optional speedup (install the "orjson" extra); fall back to
+# the stdlib encoder when it is absent
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 MAX_THREAD_TITLE_LENGTH = 100  # Named constant for magic value
 
+# Static Block Kit fragments shared by every message. They are built once at
+# import and wrapped read-only at every level so accidental mutation raises
+# instead of silently corrupting every subsequent render. stdlib json cannot
+# serialize a mappingproxy, so the cached builders below thaw them back into
+# independent plain dicts once per cache entry.
+_HEADER_BLOCK = MappingProxyType({
+    "type": "header",
+    "text": MappingProxyType({
+        "type": "plain_text",
+        "text": ":robot_face: Question from AI Assistant",
+        "emoji": True,
+    }),
+})
+_DIVIDER_BLOCK = MappingProxyType({"type": "divider"})
+
+_CONTEXT_BLOCK = MappingProxyType({
+    "type": "context",
+    "elements": (
+        MappingProxyType({
+            "type": "image",
+            "image_url": "https://api.slack.com/img/blocks/bkb_template_images/notificationsWarningIcon.png",
+            "alt_text": "AI Question",
+        }),
+        MappingProxyType({"type": "mrkdwn", "text": "*Human input requested*"}),
+    ),
+})
+
+
+def _thaw(block: Mapping) -> dict:
+    """Recursively copy a proxied block into independent plain dicts and lists."""
+    thawed: dict = {}
+    for key, value in block.items():
+        if isinstance(value, Mapping):
+            thawed[key] = _thaw(value)
+        elif isinstance(value, (list, tuple)):
+            thawed[key] = [_thaw(item) if isinstance(item, Mapping) else item for item in value]
+        else:
+            thawed[key] = value
+    return thawed
+
+
+# Matches a code-fence line; kept precompiled for the fenced-text path
+_FENCE_RE = re.compile(r"^\s*```", re.MULTILINE)
+
+# The static prefix (header, divider, context, divider) serialized once at
+# import; format_question_blocks_json only encodes the per-call suffix.
+# The trailing "]" is dropped so dynamic blocks can be appended.
+_STATIC_PREFIX_JSON = json.dumps(
+    [_thaw(_HEADER_BLOCK), _thaw(_DIVIDER_BLOCK), _thaw(_CONTEXT_BLOCK), _thaw(_DIVIDER_BLOCK)],
+    separators=(",", ":"),
+)[:-1]
+_DIVIDER_JSON = json.dumps(_thaw(_DIVIDER_BLOCK), separators=(",", ":"))
+
+
+def fallback_thread_title(question: str) -> str:
+    """Derive a thread title from the first part of the question."""
+    return question[:MAX_THREAD_TITLE_LENGTH].strip() + (
+        "..." if len(question) > MAX_THREAD_TITLE_LENGTH else ""
+    )
+
 
 def format_question_blocks(
     question: str,
@@ -13,6 +83,10 @@ def format_question_blocks(
 ) -> list[dict]:
     """Format a question using Slack Block Kit with improved structure and clarity.
 
+    Renders are deterministic, so repeat questions hit an LRU cache instead
+    of rebuilding the block dicts. The returned list is a shallow copy of
+    the cached render — do not mutate the block dicts.
+
     Args:
         question: The question text to format
         user_id: Optional user ID to mention
@@ -22,61 +96,126 @@ def format_question_blocks(
         List of Block Kit blocks
 
     """
+    return list(_question_blocks_cached(question, user_id, thread_title))
+
+
+@functools.lru_cache(maxsize=512)
+def _question_blocks_cached(
+    question: str,
+    user_id: str | None,
+    thread_title: str | None,
+) -> tuple[dict, ...]:
+    """Build the question blocks for one unique (question, user_id, thread_title)."""
     # If thread_title not provided, use first part of question
     if not thread_title:
-        thread_title = question[:MAX_THREAD_TITLE_LENGTH].strip()
-        if len(question) > MAX_THREAD_TITLE_LENGTH:
-            thread_title += "..."
+        thread_title = fallback_thread_title(question)
 
-    blocks = [
-        # Header section
-        {
-            "type": "header",
-            "text": {
-                "type": "plain_text",
-                "text": ":robot_face: Question from AI Assistant",
-                "emoji": True,
+    # Mention section only if a user is provided
+    tail: tuple[dict, ...] = (
+        (
+            {
+                "type": "section",
+                "text": {"type": "mrkdwn", "text": "*Please respond, <@" + user_id + ">:*"},
             },
-        },
-        {"type": "divider"},
-        # Context section with icon and info
-        {
-            "type": "context",
-            "elements": [
-                {
-                    "type": "image",
-                    "image_url": "https://api.slack.com/img/blocks/bkb_template_images/notificationsWarningIcon.png",
-                    "alt_text": "AI Question",
-                },
-                {"type": "mrkdwn", "text": "*Human input requested*"},
-            ],
-        },
-        {"type": "divider"},
+            _thaw(_DIVIDER_BLOCK),
+        )
+        if user_id
+        else (_thaw(_DIVIDER_BLOCK),)
+    )
+
+    # Built as one expression so the result is allocated at final size,
+    # with no append-driven resizes
+    return (
+        _thaw(_HEADER_BLOCK),
+        _thaw(_DIVIDER_BLOCK),
+        _thaw(_CONTEXT_BLOCK),
+        _thaw(_DIVIDER_BLOCK),
         # Thread title as bolded section (Slack mrkdwn uses single asterisks)
         {
             "type": "section",
-            "text": {"type": "mrkdwn", "text": f"*Thread:* {thread_title}"},
+            "text": {"type": "mrkdwn", "text": "*Thread:* " + thread_title},
         },
         # Question text as section with mrkdwn
         {"type": "section", "text": {"type": "mrkdwn", "text": question}},
-    ]
+        *tail,
+    )
+
+
+def format_question_blocks_json(
+    question: str,
+    user_id: str | None = None,
+    thread_title: str | None = None,
+) -> str:
+    """Render the question blocks straight to a JSON array string.
+
+    The static header/context prefix is serialized once at import, so each
+    call only encodes the per-question section blocks. The result can be
+    passed as-is to `chat_postMessage(blocks=...)`, which accepts a
+    pre-encoded string and skips the SDK's own re-serialization.
+
+    Args:
+        question: The question text to format
+        user_id: Optional user ID to mention
+        thread_title: Optional thread title (defaults to first part of question)
 
-    # Add user mention if provided
+    Returns:
+        JSON-encoded list of Block Kit blocks
+
+    """
+    if not thread_title:
+        thread_title = fallback_thread_title(question)
+
+    dumps = json.dumps
+    parts = [
+        _STATIC_PREFIX_JSON,
+        dumps(
+            {"type": "section", "text": {"type": "mrkdwn", "text": "*Thread:* " + thread_title}},
+            separators=(",", ":"),
+        ),
+        dumps({"type": "section", "text": {"type": "mrkdwn", "text": question}}, separators=(",", ":")),
+    ]
     if user_id:
-        blocks.append(
-            {
-                "type": "section",
-                "text": {"type": "mrkdwn", "text": f"*Please respond, <@{user_id}>:*"},
-            }
+        parts.append(
+            dumps(
+                {"type": "section", "text": {"type": "mrkdwn", "text": "*Please respond, <@" + user_id + ">:*"}},
+                separators=(",", ":"),
+            )
         )
+    parts.append(_DIVIDER_JSON + "]")
+    return ",".join(parts)
 
-    blocks.append({"type": "divider"})
-    return blocks
+
+def format_question_blocks_bytes(
+    question: str,
+    user_id: str | None = None,
+    thread_title: str | None = None,
+) -> bytes:
+    """Serialize the question blocks to JSON bytes for a raw HTTP body.
+
+    Uses orjson when installed — markedly faster than the stdlib encoder
+    for dict-heavy payloads — and otherwise falls back to the
+    pre-serialized stdlib path.
+
+    Args:
+        question: The question text to format
+        user_id: Optional user ID to mention
+        thread_title: Optional thread title (defaults to first part of question)
+
+    Returns:
+        JSON-encoded list of Block Kit blocks as bytes
+
+    """
+    if orjson is not None:
+        return orjson.dumps(format_question_blocks(question, user_id, thread_title))
+    return format_question_blocks_json(question, user_id, thread_title).encode()
 
 
 def format_thread_initial_message(thread_title: str) -> list[dict]:
     """Format the initial thread message using Block Kit with improved clarity.
 
+    Repeat titles hit an LRU cache; the returned list is a shallow copy of
+    the cached render — do not mutate the block dicts.
+
     Args:
         thread_title: Short title for the thread
 
@@ -84,21 +223,22 @@ def format_thread_initial_message(thread_title: str) -> list[dict]:
         List of Block Kit blocks
 
     """
-    return [
-        {
-            "type": "header",
-            "text": {
-                "type": "plain_text",
-                "text": ":robot_face: Question from AI Assistant",
-                "emoji": True,
-            },
-        },
-        {"type": "divider"},
+    return list(_thread_initial_cached(thread_title))
+
+
+# Titles recur from a much smaller set than full questions, so a smaller
+# cache budget suffices here
+@functools.lru_cache(maxsize=256)
+def _thread_initial_cached(thread_title: str) -> tuple[dict, ...]:
+    """Build the initial thread blocks for one unique title."""
+    return (
+        _thaw(_HEADER_BLOCK),
+        _thaw(_DIVIDER_BLOCK),
         {
             "type": "section",
-            "text": {"type": "mrkdwn", "text": f"*Thread:* {thread_title}"},
+            "text": {"type": "mrkdwn", "text": "*Thread:* " + thread_title},
         },
-    ]
+    )
 
 
 def plain_text_to_mrkdwn(text: str) -> str:
@@ -113,6 +253,11 @@ def plain_text_to_mrkdwn(text: str) -> str:
         Text formatted for Slack's mrkdwn
 
     """
+    # Fast path: no code fences means nothing to track, return as-is without
+    # paying for the per-line scan
+    if "```" not in text:
+        return text
+
     try:
         # Replace code blocks
         # This is a simple implementation, a more robust one would handle
@@ -122,8 +267,15 @@ def plain_text_to_mrkdwn(text: str) -> str:
         in_code_block = False
 
         for line in lines:
-            # Handle code blocks with triple backticks
-            if line.strip().startswith("```") or line.strip().endswith("```"):
+            # Common case: no fence on this line — one C-level containment
+            # check instead of two strip() allocations plus prefix/suffix probes
+            if "```" not in line:
+                formatted_lines.append(line)
+                continue
+
+            # Handle code blocks with triple backticks; strip once
+            stripped = line.strip()
+            if stripped.startswith("```") or stripped.endswith("```"):
                 in_code_block = not in_code_block
                 formatted_lines.append(line)
             elif in_code_block:
@@ -136,5 +288,9 @@ def plain_text_to_mrkdwn(text: str) -> str:
 
         return "\n".join(formatted_lines)
     except (ValueError, AttributeError) as e:
+        # Lazy import keeps loguru off this module's import path; this branch
+        # is defensive and should never run for str inputs
+        from loguru import logger
+
         logger.error(f"Error formatting markdown: {e}")
         return text  # Return original text if formatting fails